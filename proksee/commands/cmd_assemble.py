@@ -15,5 +15,4 @@ def cli(ctx, forward, reverse, output_dir):
 
     raise click.UsageError("command not yet implemented")
 
-    if not os.path.isdir(output_dir):
-        os.mkdir(output_dir)
+    os.makedirs(output_dir, exist_ok=True)